@@ -34,80 +34,113 @@ from .StatementBasesGenerated import (
     StatementDelSliceBase,
 )
 
+# Child visit specifications of the slice statements, per child name the
+# optionality and the change description used when it will raise.
+_assignment_slice_child_specs = (
+    (
+        "source",
+        False,
+        "Slice assignment raises exception in assigned value, removed assignment.",
+    ),
+    (
+        "expression",
+        False,
+        "Slice assignment raises exception in sliced value, removed assignment.",
+    ),
+    (
+        "lower",
+        True,
+        "Slice assignment raises exception in lower slice boundary value, "
+        "removed assignment.",
+    ),
+    (
+        "upper",
+        True,
+        "Slice assignment raises exception in upper slice boundary value, "
+        "removed assignment.",
+    ),
+)
 
-class StatementAssignmentSlice(StatementAssignmentSliceBase):
-    kind = "STATEMENT_ASSIGNMENT_SLICE"
+_del_slice_child_specs = (
+    (
+        "expression",
+        False,
+        "Slice del raises exception in sliced value, removed del",
+    ),
+    (
+        "lower",
+        True,
+        "Slice del raises exception in lower slice boundary value, removed del",
+    ),
+    (
+        "upper",
+        True,
+        "Slice del raises exception in upper slice boundary value, removed del",
+    ),
+)
 
-    named_children = ("source", "expression", "lower|optional", "upper|optional")
 
-    python_version_spec = "< 0x300"
+def _onSliceStatementChildren(statement, trace_collection, child_specs):
+    """Visit the child expressions of a slice statement.
 
-    def computeStatement(self, trace_collection):
-        source = trace_collection.onExpression(self.subnode_source)
+    Returns the computeStatement result tuple for the first child that
+    will raise, or None if all children were visited without that.
+    """
 
-        # No assignment will occur, if the assignment source raises, so strip it
-        # away.
-        if source.willRaiseAnyException():
-            result = makeStatementExpressionOnlyReplacementNode(
-                expression=source, node=self
-            )
+    evaluated = []
 
-            return (
-                result,
-                "new_raise",
-                """\
-Slice assignment raises exception in assigned value, removed assignment.""",
-            )
+    # Bind the hot method outside of the loop.
+    on_expression = trace_collection.onExpression
 
-        lookup_source = trace_collection.onExpression(self.subnode_expression)
+    for child_name, allow_none, message in child_specs:
+        expression = on_expression(
+            getattr(statement, "subnode_" + child_name), allow_none=allow_none
+        )
 
-        if lookup_source.willRaiseAnyException():
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(source, lookup_source)
-            )
+        if expression is None:
+            continue
 
-            return (
-                result,
-                "new_raise",
-                """\
-Slice assignment raises exception in sliced value, removed assignment.""",
-            )
+        if expression.willRaiseAnyException():
+            # No slice operation will occur then, only the children evaluated
+            # so far remain.
+            if evaluated:
+                evaluated.append(expression)
 
-        lower = trace_collection.onExpression(self.subnode_lower, allow_none=True)
+                result = makeStatementOnlyNodesFromExpressions(
+                    expressions=tuple(evaluated)
+                )
+            else:
+                result = makeStatementExpressionOnlyReplacementNode(
+                    expression=expression, node=statement
+                )
 
-        if lower is not None and lower.willRaiseAnyException():
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(source, lookup_source, lower)
-            )
+            return result, "new_raise", message
 
-            return (
-                result,
-                "new_raise",
-                """\
-Slice assignment raises exception in lower slice boundary value, removed \
-assignment.""",
-            )
+        evaluated.append(expression)
 
-        upper = trace_collection.onExpression(self.subnode_upper, allow_none=True)
+    return None
 
-        if upper is not None and upper.willRaiseAnyException():
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(source, lookup_source, lower, upper)
-            )
 
-            return (
-                result,
-                "new_raise",
-                """\
-Slice assignment raises exception in upper slice boundary value, removed \
-assignment.""",
-            )
+class StatementAssignmentSlice(StatementAssignmentSliceBase):
+    kind = "STATEMENT_ASSIGNMENT_SLICE"
+
+    named_children = ("source", "expression", "lower|optional", "upper|optional")
+
+    python_version_spec = "< 0x300"
+
+    def computeStatement(self, trace_collection):
+        result = _onSliceStatementChildren(
+            self, trace_collection, _assignment_slice_child_specs
+        )
 
-        return lookup_source.computeExpressionSetSlice(
+        if result is not None:
+            return result
+
+        return self.subnode_expression.computeExpressionSetSlice(
             set_node=self,
-            lower=lower,
-            upper=upper,
-            value_node=source,
+            lower=self.subnode_lower,
+            upper=self.subnode_upper,
+            value_node=self.subnode_source,
             trace_collection=trace_collection,
         )
 
@@ -117,52 +150,21 @@ class StatementDelSlice(StatementDelSliceBase):
 
     named_children = ("expression", "lower|optional", "upper|optional")
 
-    def computeStatement(self, trace_collection):
-        lookup_source = trace_collection.onExpression(self.subnode_expression)
-
-        if lookup_source.willRaiseAnyException():
-            result = makeStatementExpressionOnlyReplacementNode(
-                expression=lookup_source, node=self
-            )
-
-            return (
-                result,
-                "new_raise",
-                """\
-Slice del raises exception in sliced value, removed del""",
-            )
-
-        lower = trace_collection.onExpression(self.subnode_lower, allow_none=True)
-
-        if lower is not None and lower.willRaiseAnyException():
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(lookup_source, lower)
-            )
-
-            return (
-                result,
-                "new_raise",
-                """
-Slice del raises exception in lower slice boundary value, removed del""",
-            )
-
-        trace_collection.onExpression(self.subnode_upper, allow_none=True)
-        upper = self.subnode_upper
+    python_version_spec = "< 0x300"
 
-        if upper is not None and upper.willRaiseAnyException():
-            result = makeStatementOnlyNodesFromExpressions(
-                expressions=(lookup_source, lower, upper)
-            )
+    def computeStatement(self, trace_collection):
+        result = _onSliceStatementChildren(
+            self, trace_collection, _del_slice_child_specs
+        )
 
-            return (
-                result,
-                "new_raise",
-                """
-Slice del raises exception in upper slice boundary value, removed del""",
-            )
+        if result is not None:
+            return result
 
-        return lookup_source.computeExpressionDelSlice(
-            set_node=self, lower=lower, upper=upper, trace_collection=trace_collection
+        return self.subnode_expression.computeExpressionDelSlice(
+            set_node=self,
+            lower=self.subnode_lower,
+            upper=self.subnode_upper,
+            trace_collection=trace_collection,
         )
 
 